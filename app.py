@@ -1,6 +1,9 @@
-from flask import Flask, render_template, redirect, url_for, request, jsonify, session
-from flask_socketio import SocketIO, emit
-from flask_socketio import join_room as socketio_join_room, leave_room as socketio_leave_room
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+from flask import Flask, Blueprint, current_app, render_template, redirect, url_for, request, jsonify, session, abort, send_file
+from flask_socketio import SocketIO
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from dotenv import load_dotenv
@@ -9,132 +12,181 @@ import string
 import html
 import json
 import os
+import sys
 import logging
 import threading
-import time
 import traceback
+import functools
+import itertools
+import contextvars
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 DEBUG_LOG = os.path.join(os.path.dirname(__file__), 'debug_draw.log')
 
-def dlog(msg):
+dlog_executor = None  # mode asyncio : écritures déportées sur un thread dédié (voir asgi.py)
+
+def _append_debug_log(line):
     with open(DEBUG_LOG, 'a') as f:
-        f.write(f"{datetime.now().strftime('%H:%M:%S')} {msg}\n")
+        f.write(line)
+
+def dlog(msg):
+    line = f"{datetime.now().strftime('%H:%M:%S')} {msg}\n"
+    if dlog_executor is not None:
+        dlog_executor.submit(_append_debug_log, line)
+    else:
+        _append_debug_log(line)
 
 load_dotenv()
 from config import config
+import static_assets
 
-logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL),
-    format=config.LOG_FORMAT,
-    datefmt=config.LOG_DATE_FORMAT
-)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
-app.secret_key = config.SECRET_KEY
+# Extensions non liées : create_app() les attache à l'application
+limiter = Limiter(key_func=get_remote_address)
+socketio = SocketIO()
+bp = Blueprint("game", __name__)
+
+WORDS_FILE = os.path.join(os.path.dirname(__file__), 'words.json')
 
-app.config.update(
-    SESSION_COOKIE_HTTPONLY=config.SESSION_COOKIE_HTTPONLY,
-    SESSION_COOKIE_SAMESITE=config.SESSION_COOKIE_SAMESITE
-)
 
-limiter = Limiter(
-    app=app,
-    key_func=get_remote_address,
-    default_limits=config.RATE_LIMIT_DEFAULT
-)
+@functools.lru_cache(maxsize=None)
+def load_cards():
+    """Charge les mots depuis le fichier JSON, au premier tirage de carte."""
+    with open(WORDS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-socketio = SocketIO(app, cors_allowed_origins=config.CORS_ALLOWED_ORIGINS)
 
-# Charger les mots depuis le fichier JSON
-WORDS_FILE = os.path.join(os.path.dirname(__file__), 'words.json')
-with open(WORDS_FILE, 'r', encoding='utf-8') as f:
-    CARDS = json.load(f)
+def cleanup_rooms_tick():
+    now = datetime.now()
+    rooms_to_delete = []
+    for code, room in list(rooms.items()):
+        age = now - room.created_at
+        if not room.players or age > timedelta(hours=config.ROOM_MAX_AGE_HOURS):
+            rooms_to_delete.append(code)
+    for code in rooms_to_delete:
+        delete_room(code)
+        logger.info(f"Room {code} supprimee (cleanup)")
+    if rooms_to_delete:
+        logger.info(f"Cleanup: {len(rooms_to_delete)} salon(s) supprime(s), {len(rooms)} restant(s)")
 
 
 def cleanup_old_rooms():
-    while True:
-        time.sleep(config.ROOM_CLEANUP_INTERVAL)
+    while not _stop_workers.wait(config.ROOM_CLEANUP_INTERVAL):
         try:
-            now = datetime.now()
-            rooms_to_delete = []
-            for code, room in list(rooms.items()):
-                age = now - room.created_at
-                if not room.players or age > timedelta(hours=config.ROOM_MAX_AGE_HOURS):
-                    rooms_to_delete.append(code)
-            for code in rooms_to_delete:
-                del rooms[code]
-                logger.info(f"Room {code} supprimee (cleanup)")
-            if rooms_to_delete:
-                logger.info(f"Cleanup: {len(rooms_to_delete)} salon(s) supprime(s), {len(rooms)} restant(s)")
+            cleanup_rooms_tick()
         except Exception as e:
             logger.error(f"Erreur cleanup: {e}")
 
 
-cleanup_thread = threading.Thread(target=cleanup_old_rooms, daemon=True)
-cleanup_thread.start()
+def check_timers_tick():
+    """Un passage du scheduler : présence et transitions forcées."""
+    with emit_batch():
+        expire_presence()
+        for room_code, room in list(rooms.items()):
+            if not room.game or room.game.phase not in ("drawing_player2", "drawing_player1"):
+                continue
+            with room.lock:
+                if room.game.timer_end and time.time() >= room.game.timer_end + 2:
+                    apply_timer_expired(room_code, room)
 
 
 def check_timers():
     """Thread serveur qui vérifie les timers et force les transitions si le client ne l'a pas fait."""
-    while True:
-        time.sleep(2)
-        try:
-            for room_code, room in list(rooms.items()):
-                if not room.game or room.game.phase not in ("drawing_player2", "drawing_player1"):
-                    continue
-                if room.game.timer_end and time.time() >= room.game.timer_end + 2:
-                    result = room.game.timer_expired()
-                    if result == "switch_to_player1":
-                        socketio.emit('clear_canvas', {}, room=f"game_{room_code}")
-                        picker_name = room.game.current_picker_name
-                        socketio.emit('chat_message', {
-                            'player_name': '',
-                            'text': f"Temps ecoulé ! {picker_name} prend le relais pour dessiner !",
-                            'correct': False,
-                            'pending': False,
-                            'system': True
-                        }, room=f"game_{room_code}")
-                    emit_game_state(room_code)
-        except Exception as e:
-            logger.error(f"Erreur check_timers: {e}")
+    admission.loop_started()
+    try:
+        while True:
+            scheduled = time.monotonic() + config.TIMER_CHECK_INTERVAL
+            if _stop_workers.wait(config.TIMER_CHECK_INTERVAL):
+                return
+            try:
+                check_timers_tick()
+                enforce_memory_budget()
+            except Exception as e:
+                logger.error(f"Erreur check_timers: {e}")
+            admission.record_loop_lag(time.monotonic() - scheduled)
+    finally:
+        admission.loop_stopped()
+
+
+_stop_workers = threading.Event()
+_workers = []
+
+
+def start_background_workers():
+    """Démarre les boucles de fond du serveur threadé (le mode asyncio a ses propres tâches)."""
+    if _workers:
+        return
+    _stop_workers.clear()
+    _workers.extend([
+        threading.Thread(target=cleanup_old_rooms, name="cleanup_old_rooms", daemon=True),
+        threading.Thread(target=check_timers, name="check_timers", daemon=True),
+    ])
+    for thread in _workers:
+        thread.start()
 
 
-timer_thread = threading.Thread(target=check_timers, daemon=True)
-timer_thread.start()
+def stop_background_workers(timeout=5):
+    """Arrête les boucles de fond et attend leur fin."""
+    _stop_workers.set()
+    for thread in _workers:
+        thread.join(timeout)
+    _workers.clear()
 
 
-@app.errorhandler(Exception)
+@bp.app_errorhandler(Exception)
 def handle_exception(e):
     logger.error(f"Erreur non geree: {e}")
     logger.error(traceback.format_exc())
-    if app.debug:
+    if current_app.debug:
         return jsonify({"error": str(e), "type": type(e).__name__}), 500
     return jsonify({"error": "Une erreur interne est survenue"}), 500
 
 
-@app.errorhandler(404)
+@bp.app_errorhandler(404)
 def handle_not_found(e):
     return jsonify({"error": "Ressource non trouvee"}), 404
 
 
-@app.errorhandler(429)
+@bp.app_errorhandler(429)
 def handle_rate_limit(e):
     return jsonify({"error": "Trop de requetes, veuillez patienter"}), 429
 
 
-@app.route("/health")
+@bp.app_errorhandler(503)
+def handle_overloaded(e):
+    response = jsonify({"error": "Serveur sature, veuillez reessayer dans quelques instants"})
+    response.headers["Retry-After"] = str(config.ADMISSION_RETRY_AFTER_SECONDS)
+    return response, 503
+
+
+@bp.route("/health")
 def health_check():
     return jsonify({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "rooms_count": len(rooms),
+        "connections_count": presence.connection_count(),
+        "memory": memory_report(),
+        "load": admission.report(),
+        "startup_ms": startup_report(),
     })
 
 
 # ==================== Models ====================
 
+def deep_sizeof(obj):
+    """Estimation de la taille mémoire d'une structure JSON (dict, list, deque, str, nombres)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, deque)):
+        size += sum(deep_sizeof(v) for v in obj)
+    return size
+
+
 def validate_player_name(name):
     if not name:
         return None
@@ -153,6 +205,38 @@ class Room:
         self.game = None
         self.started = False
         self.host_player_id = None
+        self.lock = threading.Lock()  # sérialise les transitions (handlers et thread des timers)
+        self.last_activity = time.time()
+        self.chat_history = deque(maxlen=config.CHAT_HISTORY_SIZE)  # derniers messages, avec leur seq
+        self.chat_seq = 0
+        self._chat_lock = threading.Lock()
+
+    def touch(self):
+        self.last_activity = time.time()
+
+    def is_finished(self):
+        return self.game is not None and self.game.phase == "game_over"
+
+    def record_chat(self, message):
+        """Numérote un message de chat et le garde dans l'historique borné."""
+        with self._chat_lock:
+            self.chat_seq += 1
+            message = dict(message, seq=self.chat_seq)
+            self.chat_history.append(message)
+        return message
+
+    def chat_since(self, seq):
+        """Messages postérieurs à `seq`, et si des messages plus anciens ont été perdus."""
+        with self._chat_lock:
+            missed = [m for m in self.chat_history if m["seq"] > seq]
+            truncated = bool(self.chat_history) and self.chat_history[0]["seq"] > seq + 1
+        return missed, truncated
+
+    def memory_usage(self):
+        usage = deep_sizeof(self.players) + deep_sizeof(self.chat_history)
+        if self.game:
+            usage += self.game.memory_usage()
+        return usage
 
     def add_player(self, player_id, player_name):
         if len(self.players) >= self.max_players:
@@ -204,11 +288,90 @@ class Game:
         self.guessed = False  # le mot a-t-il été deviné ?
         self.timer_end = None
         self.used_cards = set()
+        self._draw_lock = threading.RLock()  # journal de traits : handlers de dessin et déchargement
+        self._draw_version = 0  # change à chaque modification du journal
+        self.draw_spill_path = None  # fichier du journal de traits déchargé sur disque
         self.draw_data = []
         self.designated_player_id = None  # joueur2 désigné
         self.current_drawer_id = None  # qui dessine actuellement
         self.point_winner_id = None  # qui a gagné le point ce tour
         self.pending_guesses = {}  # {guesser_id: {text, picker_approved, drawer_approved}}
+        self.phase_token = 0  # incrémenté à chaque transition de phase
+
+    @property
+    def draw_data(self):
+        with self._draw_lock:
+            if self.draw_spill_path:
+                self._load_spilled_draw_data()
+            return self._draw_data
+
+    @draw_data.setter
+    def draw_data(self, value):
+        with self._draw_lock:
+            self.discard_spill()
+            self._draw_data = value
+            self.draw_bytes = deep_sizeof(value)
+            self._draw_version += 1
+
+    def add_stroke(self, draw_event):
+        with self._draw_lock:
+            self.draw_data.append(draw_event)
+            self.draw_bytes += deep_sizeof(draw_event)
+            self._draw_version += 1
+
+    def spill_draw_data(self, path):
+        """Décharge le journal de traits sur disque. Retourne le nombre d'octets libérés.
+
+        L'écriture se fait hors du verrou, sur une copie : les handlers de dessin
+        ne l'attendent pas. Si un trait arrive entre-temps, rien n'est déchargé.
+        """
+        with self._draw_lock:
+            if self.draw_spill_path or not self._draw_data:
+                return 0
+            snapshot = list(self._draw_data)
+            version = self._draw_version
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        with self._draw_lock:
+            if self.draw_spill_path or self._draw_version != version:
+                os.remove(path + ".tmp")
+                return 0
+            os.replace(path + ".tmp", path)
+            freed = self.draw_bytes
+            self._draw_data = []
+            self.draw_bytes = 0
+            self.draw_spill_path = path
+            return freed
+
+    def _load_spilled_draw_data(self):
+        path = self.draw_spill_path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Relecture du journal de traits {path} impossible: {e}")
+            data = []
+        self.draw_data = data
+
+    def discard_spill(self):
+        with self._draw_lock:
+            if self.draw_spill_path:
+                try:
+                    os.remove(self.draw_spill_path)
+                except OSError:
+                    pass
+                self.draw_spill_path = None
+
+    def memory_usage(self):
+        return self.draw_bytes + deep_sizeof(self.pending_guesses)
+
+    def _set_phase(self, phase):
+        self.phase = phase
+        self.phase_token += 1
+
+    def accepts(self, token):
+        """Une requête client de transition n'est valable que pour la phase qu'elle a vue."""
+        return token == self.phase_token
 
     @property
     def current_picker_id(self):
@@ -219,10 +382,11 @@ class Game:
         return self.player_names[self.current_picker_index]
 
     def pick_card(self):
-        available = [c for c in CARDS if c["carte"] not in self.used_cards]
+        cards = load_cards()
+        available = [c for c in cards if c["carte"] not in self.used_cards]
         if not available:
             self.used_cards.clear()
-            available = CARDS
+            available = cards
         self.current_card = random.choice(available)
         self.used_cards.add(self.current_card["carte"])
         return self.current_card
@@ -241,7 +405,7 @@ class Game:
         self.current_word = self.current_card["mots"][word_index]
         self.designated_player_id = designated_id
         self.current_drawer_id = designated_id
-        self.phase = "drawing_player2"
+        self._set_phase("drawing_player2")
         self.timer_end = time.time() + self.DRAW_TIME
         self.guessed = False
         self.point_winner_id = None
@@ -303,7 +467,7 @@ class Game:
         """Appelé quand le timer expire. Gère la transition de phase."""
         if self.phase == "drawing_player2":
             # Joueur2 n'a pas réussi, c'est au tour de joueur1
-            self.phase = "drawing_player1"
+            self._set_phase("drawing_player1")
             self.current_drawer_id = self.current_picker_id
             self.timer_end = time.time() + self.DRAW_TIME
             self.draw_data = []
@@ -318,7 +482,7 @@ class Game:
         return None
 
     def end_drawing(self):
-        self.phase = "round_end"
+        self._set_phase("round_end")
         self.timer_end = None
 
     def next_turn(self):
@@ -326,9 +490,9 @@ class Game:
         if self.current_picker_index == 0:
             self.round += 1
         if self.round > self.total_rounds:
-            self.phase = "game_over"
+            self._set_phase("game_over")
             return False
-        self.phase = "choosing"
+        self._set_phase("choosing")
         self.current_word = None
         self.current_card = None
         self.draw_data = []
@@ -357,6 +521,7 @@ class Game:
         player_names_dict = dict(zip(self.player_ids, self.player_names))
         state = {
             "phase": self.phase,
+            "phase_token": self.phase_token,
             "round": self.round,
             "total_rounds": self.total_rounds,
             "current_picker_id": self.current_picker_id,
@@ -418,58 +583,545 @@ def generate_room_code():
             return code
 
 
-# ==================== WebSocket State ====================
+def delete_room(code):
+    room = rooms.pop(code, None)
+    if room is None:
+        return
+    if room.game:
+        room.game.discard_spill()
+    presence.forget_room(code)
 
-def emit_game_state(room_code):
-    if room_code not in rooms:
+
+# ==================== Memory ====================
+
+def memory_usage():
+    return sum(room.memory_usage() for room in list(rooms.values()))
+
+
+def memory_report():
+    return {
+        "used_bytes": memory_usage(),
+        "budget_bytes": config.MEMORY_BUDGET_MB * 1024 * 1024,
+        "spilled_draw_logs": sum(1 for room in list(rooms.values()) if room.game and room.game.draw_spill_path),
+    }
+
+
+def _spill_path(code):
+    # Sous-dossier par processus : plusieurs workers peuvent héberger le même code de salon
+    directory = os.path.join(config.DRAW_SPILL_DIR, str(os.getpid()))
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{code}.json")
+
+
+def _draw_is_cold(room, now):
+    if room.game is None:
+        return False
+    if room.game.phase not in ("drawing_player2", "drawing_player1"):
+        return True
+    return now - room.last_activity >= config.DRAW_SPILL_IDLE_SECONDS
+
+
+def _is_evictable(room, now):
+    """Salon terminé, ou abandonné : aucun joueur présent (ni en période de grâce) et inactif."""
+    if room.is_finished():
+        return True
+    if room.game and room.game.phase in ("drawing_player2", "drawing_player1"):
+        return False
+    if presence.present_players(room.code, room.players):
+        return False
+    return now - room.last_activity >= config.ROOM_EVICT_IDLE_SECONDS
+
+
+def enforce_memory_budget():
+    """Décharge les journaux de traits froids puis évince les salons terminés ou abandonnés (LRU).
+
+    Écrit sur disque : en mode asyncio, appelé hors de la boucle (asyncio.to_thread).
+    """
+    budget = config.MEMORY_BUDGET_MB * 1024 * 1024
+    usage = memory_usage()
+    if usage <= budget:
         return
-    room = rooms[room_code]
-    if not room.game:
+    now = time.time()
+    by_activity = sorted(list(rooms.items()), key=lambda item: item[1].last_activity)
+
+    for code, room in by_activity:
+        if usage <= budget:
+            return
+        if _draw_is_cold(room, now):
+            usage -= room.game.spill_draw_data(_spill_path(code))
+
+    for code, room in by_activity:
+        if usage <= budget:
+            return
+        if _is_evictable(room, now):
+            usage -= room.memory_usage()
+            delete_room(code)
+            logger.warning(f"Room {code} evincee (budget memoire depasse)")
+
+
+# ==================== Presence ====================
+
+class Presence:
+    """Registre des sockets actives par joueur.
+
+    Un joueur peut avoir plusieurs sids (plusieurs onglets). Quand sa dernière
+    socket se ferme, il reste considéré présent pendant `grace_seconds` pour
+    absorber un rechargement de page ou le passage lobby -> partie.
+    """
+
+    def __init__(self, grace_seconds):
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        self._rooms = {}  # {room_code: {player_id: set(sids)}}
+        self._by_sid = {}  # {sid: (room_code, player_id)}
+        self._offline_since = {}  # {(room_code, player_id): timestamp}
+
+    def connect(self, sid, room_code, player_id):
+        """Associe une socket à un joueur. Retourne True si le joueur n'était pas déjà présent."""
+        with self._lock:
+            self._detach(sid)
+            players = self._rooms.setdefault(room_code, {})
+            sids = players.setdefault(player_id, set())
+            was_present = bool(sids) or (room_code, player_id) in self._offline_since
+            sids.add(sid)
+            self._by_sid[sid] = (room_code, player_id)
+            self._offline_since.pop((room_code, player_id), None)
+            return not was_present
+
+    def disconnect(self, sid):
+        """Retire une socket. Retourne (room_code, player_id) ou None si la sid était inconnue."""
+        with self._lock:
+            return self._detach(sid)
+
+    def _detach(self, sid):
+        key = self._by_sid.pop(sid, None)
+        if key is None:
+            return None
+        room_code, player_id = key
+        sids = self._rooms.get(room_code, {}).get(player_id)
+        if sids is not None:
+            sids.discard(sid)
+            if not sids:
+                self._offline_since[key] = time.time()
+        return key
+
+    def sids(self, room_code, player_id):
+        with self._lock:
+            return list(self._rooms.get(room_code, {}).get(player_id, ()))
+
+    def is_connected(self, room_code, player_id):
+        with self._lock:
+            return bool(self._rooms.get(room_code, {}).get(player_id))
+
+    def connected_players(self, room_code, player_ids):
+        with self._lock:
+            players = self._rooms.get(room_code, {})
+            return [pid for pid in player_ids if players.get(pid)]
+
+    def present_players(self, room_code, player_ids):
+        """Joueurs connectés ou encore dans leur période de grâce."""
+        with self._lock:
+            players = self._rooms.get(room_code, {})
+            return [pid for pid in player_ids
+                    if players.get(pid) or (room_code, pid) in self._offline_since]
+
+    def connection_count(self):
+        with self._lock:
+            return len(self._by_sid)
+
+    def expire(self):
+        """Retourne les (room_code, player_id) dont la période de grâce est écoulée et les oublie."""
+        deadline = time.time() - self.grace_seconds
+        with self._lock:
+            expired = [key for key, since in self._offline_since.items() if since <= deadline]
+            for room_code, player_id in expired:
+                del self._offline_since[(room_code, player_id)]
+                players = self._rooms.get(room_code)
+                if players is not None and not players.get(player_id):
+                    players.pop(player_id, None)
+                    if not players:
+                        del self._rooms[room_code]
+            return expired
+
+    def forget_room(self, room_code):
+        with self._lock:
+            for sids in self._rooms.pop(room_code, {}).values():
+                for sid in sids:
+                    self._by_sid.pop(sid, None)
+            for key in [k for k in self._offline_since if k[0] == room_code]:
+                del self._offline_since[key]
+
+
+presence = None  # Presence, créée par create_app (voir _reset_state)
+
+
+def expire_presence():
+    """Retire du lobby les joueurs partis depuis plus que la période de grâce."""
+    for room_code, player_id in presence.expire():
+        room = rooms.get(room_code)
+        if not room or player_id not in room.players:
+            continue
+        if room.started:
+            logger.info(f"Joueur {player_id} deconnecte de la partie {room_code}")
+            continue
+        room.remove_player(player_id)
+        logger.info(f"Joueur {player_id} retire du salon {room_code} (deconnecte)")
+        emit_lobby_state(room_code)
+
+
+# ==================== Admission ====================
+
+class AdmissionController:
+    """Refuse les nouveaux salons et joueurs quand le serveur prend du retard.
+
+    Trois signaux, lissés (moyenne exponentielle), chacun avec son seuil :
+    - la durée d'exécution des handlers Socket.IO (ADMISSION_MAX_HANDLER_LAG_MS),
+      ou l'âge du plus ancien handler encore en cours s'il est plus grand ;
+    - le retard de la boucle des timers (ADMISSION_MAX_LOOP_LAG_MS), ou le retard
+      du prochain passage tant qu'il n'est pas arrivé (boucle démarrée seulement) ;
+    - en mode asyncio, l'attente dans la file d'envoi (ADMISSION_MAX_QUEUE_DELAY_MS).
+    Une mesure lissée plus vieille que `window` est considérée nulle : un signal
+    bloqué reste visible par le handler en cours ou le passage en retard.
+    """
+
+    SMOOTHING = 0.2
+
+    def __init__(self, max_handler_lag, max_loop_lag, max_queue_delay, window, loop_interval):
+        self.max_handler_lag = max_handler_lag
+        self.max_loop_lag = max_loop_lag
+        self.max_queue_delay = max_queue_delay
+        self.window = window
+        self.loop_interval = loop_interval
+        self._handler_lag = (0.0, 0.0)  # (valeur lissée, instant de la dernière mesure)
+        self._loop_lag = (0.0, 0.0)
+        self._queue_delay = (0.0, 0.0)
+        self._lock = threading.Lock()
+        self._running = {}  # {jeton: début} des handlers en cours
+        self._tokens = itertools.count()
+        self._last_tick = None  # fin du dernier passage de la boucle des timers
+
+    def _smooth(self, previous, sample):
+        value, _ = previous
+        return (value + self.SMOOTHING * (sample - value), time.monotonic())
+
+    def handler_started(self):
+        with self._lock:
+            token = next(self._tokens)
+            self._running[token] = time.monotonic()
+        return token
+
+    def handler_finished(self, token):
+        with self._lock:
+            started = self._running.pop(token)
+        self._handler_lag = self._smooth(self._handler_lag, time.monotonic() - started)
+
+    def loop_started(self):
+        self._last_tick = time.monotonic()
+
+    def loop_stopped(self):
+        # Boucle arrêtée : plus de passage attendu, donc pas de retard à compter
+        self._last_tick = None
+
+    def record_loop_lag(self, seconds):
+        self._loop_lag = self._smooth(self._loop_lag, max(0.0, seconds))
+        if self._last_tick is not None:
+            self._last_tick = time.monotonic()
+
+    def record_queue_delay(self, seconds):
+        self._queue_delay = self._smooth(self._queue_delay, seconds)
+
+    def _current(self, measure):
+        value, measured_at = measure
+        return value if time.monotonic() - measured_at <= self.window else 0.0
+
+    def handler_lag(self):
+        with self._lock:
+            oldest = min(self._running.values(), default=None)
+        running = time.monotonic() - oldest if oldest is not None else 0.0
+        return max(self._current(self._handler_lag), running)
+
+    def loop_lag(self):
+        last_tick = self._last_tick
+        overdue = time.monotonic() - last_tick - self.loop_interval if last_tick is not None else 0.0
+        return max(self._current(self._loop_lag), overdue)
+
+    def queue_delay(self):
+        return self._current(self._queue_delay)
+
+    def overloaded(self):
+        return (self.handler_lag() > self.max_handler_lag
+                or self.loop_lag() > self.max_loop_lag
+                or self.queue_delay() > self.max_queue_delay)
+
+    def report(self):
+        return {
+            "handler_lag_ms": round(self.handler_lag() * 1000, 1),
+            "loop_lag_ms": round(self.loop_lag() * 1000, 1),
+            "queue_delay_ms": round(self.queue_delay() * 1000, 1),
+            "overloaded": self.overloaded(),
+        }
+
+
+admission = None  # AdmissionController, créé par create_app (voir _reset_state)
+
+
+def admission_control(view):
+    """Rejette tôt (503 + Retry-After) la création et l'entrée dans un salon sous saturation."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method == "POST" and admission.overloaded():
+            logger.warning(f"Admission refusee sur {request.path}: {admission.report()}")
+            abort(503)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+# ==================== Socket transport ====================
+
+_connection = contextvars.ContextVar('connection', default=None)  # (sid, player_id) hors contexte Flask-SocketIO
+
+
+class SocketIOTransport:
+    """Envoi Socket.IO via Flask-SocketIO (serveur threadé). asgi.py le remplace en mode asyncio."""
+
+    def emit(self, event, data, to=None, skip_sid=None):
+        socketio.emit(event, data, to=to, skip_sid=skip_sid)
+
+    def enter_room(self, sid, room):
+        socketio.server.enter_room(sid, room, namespace='/')
+
+    def leave_room(self, sid, room):
+        socketio.server.leave_room(sid, room, namespace='/')
+
+
+transport = SocketIOTransport()
+EVENT_HANDLERS = {}
+
+
+def on_event(name):
+    """Enregistre un handler Socket.IO, partagé par le serveur threadé et le mode asyncio."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        def timed(*args, **kwargs):
+            token = admission.handler_started()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                admission.handler_finished(token)
+        EVENT_HANDLERS[name] = timed
+        socketio.on(name)(timed)
+        return handler
+    return decorator
+
+
+@contextmanager
+def connection_context(sid, player_id):
+    token = _connection.set((sid, player_id))
+    try:
+        yield
+    finally:
+        _connection.reset(token)
+
+
+def current_sid():
+    conn = _connection.get()
+    return conn[0] if conn else request.sid
+
+
+def current_player_id():
+    conn = _connection.get()
+    return conn[1] if conn else session.get('player_id')
+
+
+# ==================== WebSocket State ====================
+
+_batch_local = threading.local()
+
+
+class EmitBatch:
+    """Émissions collectées pendant un handler ou un tick du scheduler.
+
+    Les messages d'un salon sont regroupés en une seule trame par client,
+    et les pushs d'état successifs sont fusionnés en un seul (le plus récent,
+    calculé au moment du flush).
+    """
+
+    def __init__(self):
+        self.rooms = {}  # {room_code: {"events": [(event, data)], "game_state": bool, "lobby_state": bool}}
+
+    def _room(self, room_code):
+        return self.rooms.setdefault(room_code, {"events": [], "game_state": False, "lobby_state": False})
+
+    def add_event(self, room_code, event, data):
+        self._room(room_code)["events"].append((event, data))
+
+    def mark_game_state(self, room_code):
+        self._room(room_code)["game_state"] = True
+
+    def mark_lobby_state(self, room_code):
+        self._room(room_code)["lobby_state"] = True
+
+    def flush(self):
+        for room_code, pending in self.rooms.items():
+            if pending["events"] or pending["game_state"]:
+                _send_game_frames(room_code, pending["events"], pending["game_state"])
+            if pending["lobby_state"]:
+                _send_lobby_state(room_code)
+        self.rooms = {}
+
+
+def current_batch():
+    return getattr(_batch_local, "batch", None)
+
+
+@contextmanager
+def emit_batch():
+    """Regroupe les émissions du bloc ; les blocs imbriqués partagent le lot extérieur."""
+    batch = current_batch()
+    if batch is not None:
+        yield batch
         return
-    # Envoyer un état personnalisé à chaque joueur
-    for pid in room.players:
-        state = room.game.get_state(for_player_id=pid)
-        socketio.emit('game_state_updated', state, room=f"player_{room_code}_{pid}")
+    batch = EmitBatch()
+    _batch_local.batch = batch
+    try:
+        yield batch
+    finally:
+        _batch_local.batch = None
+        batch.flush()
+
+
+def batched(handler):
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        with emit_batch():
+            return handler(*args, **kwargs)
+    return wrapper
+
+
+def _emit_frame(frame, sid):
+    if len(frame) == 1:
+        event, data = frame[0]
+        transport.emit(event, data, to=sid)
+    else:
+        transport.emit('batch', [{"event": event, "data": data} for event, data in frame], to=sid)
 
 
-def emit_lobby_state(room_code):
-    if room_code not in rooms:
+def _send_game_frames(room_code, events, with_state):
+    room = rooms.get(room_code)
+    if not room:
         return
-    room = rooms[room_code]
-    socketio.emit('lobby_updated', {
-        "players": [{"id": pid, "name": pname} for pid, pname in room.players.items()],
+    with_state = with_state and room.game is not None
+    # Une trame par joueur connecté, directement sur ses sids ; pas d'état calculé pour les absents
+    for pid in room.players:
+        sids = presence.sids(room_code, pid)
+        if not sids:
+            continue
+        frame = list(events)
+        if with_state:
+            frame.append(('game_state_updated', room.game.get_state(for_player_id=pid)))
+        if not frame:
+            continue
+        for sid in sids:
+            _emit_frame(frame, sid)
+
+
+def _lobby_payload(room):
+    connected = set(presence.connected_players(room.code, room.players))
+    return {
+        "players": [
+            {"id": pid, "name": pname, "connected": pid in connected}
+            for pid, pname in room.players.items()
+        ],
         "host_id": room.host_player_id,
         "started": room.started,
         "max_players": room.max_players
-    }, room=f"lobby_{room_code}")
+    }
+
+
+def _send_lobby_state(room_code, to=None):
+    room = rooms.get(room_code)
+    if not room:
+        return
+    transport.emit('lobby_updated', _lobby_payload(room), to=to or f"lobby_{room_code}")
+
+
+def emit_to_game(room_code, event, data):
+    batch = current_batch()
+    if batch is not None:
+        batch.add_event(room_code, event, data)
+    else:
+        _send_game_frames(room_code, [(event, data)], False)
+
+
+def emit_chat(room, message):
+    emit_to_game(room.code, 'chat_message', room.record_chat(message))
+
+
+def emit_game_state(room_code):
+    batch = current_batch()
+    if batch is not None:
+        batch.mark_game_state(room_code)
+    else:
+        _send_game_frames(room_code, [], True)
+
+
+def emit_lobby_state(room_code):
+    batch = current_batch()
+    if batch is not None:
+        batch.mark_lobby_state(room_code)
+    else:
+        _send_lobby_state(room_code)
 
 
 # ==================== WebSocket Handlers ====================
 
-@socketio.on('join_lobby')
-def handle_join_lobby(data):
-    room_code = data.get('room')
-    socketio_join_room(f"lobby_{room_code}")
-    emit_lobby_state(room_code)
+@on_event('disconnect')
+def handle_disconnect():
+    key = presence.disconnect(current_sid())
+    if key:
+        logger.debug(f"Socket {current_sid()} fermee pour joueur {key[1]} (salon {key[0]})")
 
 
-@socketio.on('join_game')
+@on_event('join_lobby')
+def handle_join_lobby(data):
+    room_code = data.get('room')
+    player_id = current_player_id()
+    transport.enter_room(current_sid(), f"lobby_{room_code}")
+    if room_code in rooms and player_id in rooms[room_code].players:
+        rooms[room_code].touch()
+        if presence.connect(current_sid(), room_code, player_id):
+            emit_lobby_state(room_code)
+            return
+    # Reconnexion (ou spectateur) : rien n'a changé pour les autres, seul ce client a besoin de l'état
+    _send_lobby_state(room_code, to=current_sid())
+
+
+@on_event('join_game')
 def handle_join_game(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
-    # Chaque joueur rejoint sa propre room pour recevoir un état personnalisé
-    socketio_join_room(f"player_{room_code}_{player_id}")
-    # Aussi une room commune pour le dessin
-    socketio_join_room(f"game_{room_code}")
+    player_id = current_player_id()
+    # Room commune pour le dessin ; l'état personnalisé est envoyé directement sur la sid
+    transport.enter_room(current_sid(), f"game_{room_code}")
+    if room_code in rooms and player_id in rooms[room_code].players:
+        rooms[room_code].touch()
+        presence.connect(current_sid(), room_code, player_id)
     if room_code in rooms and rooms[room_code].game:
-        state = rooms[room_code].game.get_state(for_player_id=player_id)
-        emit('game_state_updated', state)
-
-
-@socketio.on('draw')
+        room = rooms[room_code]
+        since = data.get('since', 0)
+        if not isinstance(since, int) or since < 0:
+            since = 0
+        # Rattrapage : état courant puis messages manqués depuis le curseur, en une seule trame
+        missed, truncated = room.chat_since(since)
+        frame = [('game_state_updated', room.game.get_state(for_player_id=player_id))]
+        if missed or truncated:
+            frame.append(('chat_history', {'messages': missed, 'truncated': truncated}))
+        _emit_frame(frame, current_sid())
+
+
+@on_event('draw')
 def handle_draw(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     dlog(f"[DRAW] recu de player_id={player_id}, room={room_code}")
     if room_code not in rooms:
         dlog(f"[DRAW] REJET: room {room_code} inexistante")
@@ -483,15 +1135,16 @@ def handle_draw(data):
         return
     draw_event = data.get('draw_event')
     if draw_event:
-        room.game.draw_data.append(draw_event)
+        room.game.add_stroke(draw_event)
+        room.touch()
         dlog(f"[DRAW] OK: enregistre, total={len(room.game.draw_data)}, broadcast vers game_{room_code}")
-        emit('draw_event', draw_event, room=f"game_{room_code}", include_self=False)
+        transport.emit('draw_event', draw_event, to=f"game_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('request_draw_data')
+@on_event('request_draw_data')
 def handle_request_draw_data(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     if room_code not in rooms:
         dlog(f"[SYNC] REJET: room {room_code} inexistante")
         return
@@ -500,33 +1153,34 @@ def handle_request_draw_data(data):
         dlog(f"[SYNC] REJET: pas de game")
         return
     dlog(f"[SYNC] envoi de {len(room.game.draw_data)} events a player={player_id}")
-    emit('draw_data_sync', {'draw_data': room.game.draw_data})
+    transport.emit('draw_data_sync', {'draw_data': room.game.draw_data}, to=current_sid())
 
 
-@socketio.on('client_log')
+@on_event('client_log')
 def handle_client_log(data):
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     msg = data.get('msg', '')
     dlog(f"[CLIENT {player_id}] {msg}")
 
 
-@socketio.on('clear_canvas')
+@on_event('clear_canvas')
 def handle_clear_canvas(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     if room_code not in rooms:
         return
     room = rooms[room_code]
     if not room.game or player_id != room.game.current_drawer_id:
         return
     room.game.draw_data = []
-    emit('clear_canvas', {}, room=f"game_{room_code}", include_self=False)
+    transport.emit('clear_canvas', {}, to=f"game_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('guess')
+@on_event('guess')
+@batched
 def handle_guess(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     guess_text = data.get('text', '').strip()
     if not guess_text or room_code not in rooms:
         return
@@ -534,163 +1188,219 @@ def handle_guess(data):
     if not room.game:
         return
 
-    result = room.game.check_guess(player_id, guess_text)
+    room.touch()
+    with room.lock:
+        result = room.game.check_guess(player_id, guess_text)
     player_name = room.players.get(player_id, "???")
 
     if result == "correct":
-        socketio.emit('chat_message', {
+        emit_chat(room, {
             "player_name": player_name,
             "text": guess_text,
             "correct": True
-        }, room=f"game_{room_code}")
+        })
         emit_game_state(room_code)
     elif result == "pending":
-        socketio.emit('chat_message', {
+        emit_chat(room, {
             "player_name": player_name,
             "text": guess_text,
             "correct": False,
             "pending": True,
             "guesser_id": player_id
-        }, room=f"game_{room_code}")
+        })
         emit_game_state(room_code)
     else:
-        socketio.emit('chat_message', {
+        emit_chat(room, {
             "player_name": player_name,
             "text": guess_text,
             "correct": False
-        }, room=f"game_{room_code}")
+        })
 
 
-@socketio.on('validate_guess')
+@on_event('validate_guess')
+@batched
 def handle_validate_guess(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     guesser_id = data.get('guesser_id', '')
     if not room_code or room_code not in rooms:
         return
     room = rooms[room_code]
-    if not room.game:
+    if not room.game or not room.game.accepts(data.get('token')):
         return
-    accepted = room.game.validate_guess(player_id, guesser_id)
+    with room.lock:
+        if not room.game.accepts(data.get('token')):
+            return
+        accepted = room.game.validate_guess(player_id, guesser_id)
+    room.touch()
     if accepted:
         guesser_name = room.players.get(guesser_id, "???")
-        socketio.emit('chat_message', {
+        emit_chat(room, {
             "player_name": guesser_name,
             "text": "",
             "correct": True
-        }, room=f"game_{room_code}")
+        })
     emit_game_state(room_code)
 
 
-@socketio.on('choose_word')
+@on_event('choose_word')
+@batched
 def handle_choose_word(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     word_index = data.get('index', -1)
     designated_id = data.get('designated_id', '')
     if room_code not in rooms:
         return
     room = rooms[room_code]
-    if not room.game or player_id != room.game.current_picker_id:
+    if not room.game or not room.game.accepts(data.get('token')):
         return
-    if room.game.choose_word_and_player(word_index, designated_id):
+    if player_id != room.game.current_picker_id:
+        return
+    with room.lock:
+        if not room.game.accepts(data.get('token')):
+            return
+        chosen = room.game.choose_word_and_player(word_index, designated_id)
+    room.touch()
+    if chosen:
         emit_game_state(room_code)
 
 
-@socketio.on('request_next_turn')
+@on_event('request_next_turn')
+@batched
 def handle_next_turn(data):
     room_code = data.get('room')
-    player_id = session.get('player_id')
+    player_id = current_player_id()
     if room_code not in rooms:
         return
     room = rooms[room_code]
-    if not room.game:
+    if not room.game or not room.game.accepts(data.get('token')):
         return
     if player_id != room.host_player_id:
         return
-    if room.game.phase == "round_end":
+    with room.lock:
+        if not room.game.accepts(data.get('token')) or room.game.phase != "round_end":
+            return
         room.game.next_turn()
         if room.game.phase == "choosing":
             room.game.pick_card()
-        emit_game_state(room_code)
+    room.touch()
+    emit_game_state(room_code)
+
+
+def apply_timer_expired(room_code, room):
+    """Applique l'expiration du timer ; l'appelant tient room.lock."""
+    result = room.game.timer_expired()
+    if result == "switch_to_player1":
+        # Effacer le canvas pour le nouveau dessinateur
+        emit_to_game(room_code, 'clear_canvas', {})
+        # Notifier tout le monde que le picker prend le relais
+        picker_name = room.game.current_picker_name
+        emit_chat(room, {
+            'player_name': '',
+            'text': f"Temps ecoulé ! {picker_name} prend le relais pour dessiner !",
+            'correct': False,
+            'pending': False,
+            'system': True
+        })
+    emit_game_state(room_code)
 
 
-@socketio.on('timer_expired')
+@on_event('timer_expired')
+@batched
 def handle_timer_expired(data):
     room_code = data.get('room')
     if room_code not in rooms:
         return
     room = rooms[room_code]
-    if not room.game or room.game.phase not in ("drawing_player2", "drawing_player1"):
+    # Tous les clients envoient timer_expired au même moment : seul le premier porteur
+    # du jeton courant déclenche la transition, les autres sont écartés ici
+    if not room.game or not room.game.accepts(data.get('token')):
         return
-    if room.game.is_time_up():
-        result = room.game.timer_expired()
-        if result == "switch_to_player1":
-            # Effacer le canvas pour le nouveau dessinateur
-            socketio.emit('clear_canvas', {}, room=f"game_{room_code}")
-            # Notifier tout le monde que le picker prend le relais
-            picker_name = room.game.current_picker_name
-            socketio.emit('chat_message', {
-                'player_name': '',
-                'text': f"Temps ecoulé ! {picker_name} prend le relais pour dessiner !",
-                'correct': False,
-                'pending': False,
-                'system': True
-            }, room=f"game_{room_code}")
-        emit_game_state(room_code)
+    if room.game.phase not in ("drawing_player2", "drawing_player1"):
+        return
+    with room.lock:
+        if not room.game.accepts(data.get('token')) or not room.game.is_time_up():
+            return
+        apply_timer_expired(room_code, room)
 
 
 # WebRTC Voice Chat
-@socketio.on('join_voice')
+@on_event('join_voice')
 def handle_join_voice(data):
     room_code = data.get('room')
-    socketio_join_room(f"voice_{room_code}")
-    emit('user_joined', {'player_id': session.get('player_id')}, room=f"voice_{room_code}", include_self=False)
+    transport.enter_room(current_sid(), f"voice_{room_code}")
+    transport.emit('user_joined', {'player_id': current_player_id()}, to=f"voice_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('offer')
+@on_event('offer')
 def handle_offer(data):
     room_code = data.get('room')
-    emit('offer', {
+    transport.emit('offer', {
         'offer': data.get('offer'),
-        'from': session.get('player_id')
-    }, room=f"voice_{room_code}", include_self=False)
+        'from': current_player_id()
+    }, to=f"voice_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('answer')
+@on_event('answer')
 def handle_answer(data):
     room_code = data.get('room')
-    emit('answer', {
+    transport.emit('answer', {
         'answer': data.get('answer'),
-        'from': session.get('player_id')
-    }, room=f"voice_{room_code}", include_self=False)
+        'from': current_player_id()
+    }, to=f"voice_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('ice_candidate')
+@on_event('ice_candidate')
 def handle_ice_candidate(data):
     room_code = data.get('room')
-    emit('ice_candidate', {
+    transport.emit('ice_candidate', {
         'candidate': data.get('candidate'),
-        'from': session.get('player_id')
-    }, room=f"voice_{room_code}", include_self=False)
+        'from': current_player_id()
+    }, to=f"voice_{room_code}", skip_sid=current_sid())
 
 
-@socketio.on('leave_voice')
+@on_event('leave_voice')
 def handle_leave_voice(data):
     room_code = data.get('room')
-    socketio_leave_room(f"voice_{room_code}")
-    emit('user_left', {'player_id': session.get('player_id')}, room=f"voice_{room_code}")
+    transport.leave_room(current_sid(), f"voice_{room_code}")
+    transport.emit('user_left', {'player_id': current_player_id()}, to=f"voice_{room_code}")
 
 
 # ==================== HTTP Routes ====================
 
-@app.route("/")
+@bp.app_template_global()
+def asset_url(name):
+    return url_for(".static_asset", filename=static_assets.built_name(name))
+
+
+@bp.route("/static/<path:filename>")
+def static_asset(filename):
+    accepted = [enc for enc, _ in static_assets.ENCODINGS if request.accept_encodings[enc]]
+    asset = static_assets.resolve(filename, accepted)
+    if asset is None:
+        abort(404)
+    # Un nom construit contient le hash du contenu : il ne changera jamais.
+    # Les sources non construites restent revalidées (no-cache + ETag).
+    max_age = config.STATIC_MAX_AGE_SECONDS if asset.immutable else None
+    response = send_file(asset.path, mimetype=asset.mimetype, etag=asset.etag or True,
+                         conditional=True, max_age=max_age)
+    if asset.encoding:
+        response.headers["Content-Encoding"] = asset.encoding
+    response.vary.add("Accept-Encoding")
+    if asset.immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+@bp.route("/")
 def index():
     return render_template("index.html")
 
 
-@app.route("/create", methods=["GET", "POST"])
-@limiter.limit(config.RATE_LIMIT_CREATE)
+@bp.route("/create", methods=["GET", "POST"])
+@limiter.limit(lambda: config.RATE_LIMIT_CREATE)
+@admission_control
 def create_room():
     if request.method == "POST":
         code = generate_room_code()
@@ -705,13 +1415,14 @@ def create_room():
 
         room.add_player(player_id, player_name)
         logger.info(f"Salon {code} cree par {player_name}")
-        return redirect(url_for("lobby", code=code))
+        return redirect(url_for(".lobby", code=code))
 
     return render_template("create_room.html")
 
 
-@app.route("/join", methods=["GET", "POST"])
-@limiter.limit(config.RATE_LIMIT_JOIN)
+@bp.route("/join", methods=["GET", "POST"])
+@limiter.limit(lambda: config.RATE_LIMIT_JOIN)
+@admission_control
 def join_room():
     if request.method == "POST":
         code = request.form.get("code", "").upper()
@@ -728,28 +1439,29 @@ def join_room():
 
         if not room.add_player(player_id, player_name):
             return render_template("join_room.html", error="Impossible de rejoindre cette partie")
+        room.touch()
 
         logger.info(f"Joueur {player_name} a rejoint le salon {code}")
-        emit_lobby_state(code)
-        return redirect(url_for("lobby", code=code))
+        # Les autres joueurs sont prévenus par join_lobby, quand sa socket se connecte
+        return redirect(url_for(".lobby", code=code))
 
     return render_template("join_room.html")
 
 
-@app.route("/lobby/<code>")
+@bp.route("/lobby/<code>")
 def lobby(code):
     if code not in rooms:
-        return redirect(url_for("index"))
+        return redirect(url_for(".index"))
     room = rooms[code]
     player_id = session.get('player_id')
     if player_id not in room.players:
-        return redirect(url_for("join_room"))
+        return redirect(url_for(".join_room"))
     if room.started:
-        return redirect(url_for("play_game", code=code))
+        return redirect(url_for(".play_game", code=code))
     return render_template("lobby.html", room=room, player_id=player_id)
 
 
-@app.route("/lobby/<code>/start", methods=["POST"])
+@bp.route("/lobby/<code>/start", methods=["POST"])
 def start_room(code):
     if code not in rooms:
         return "Room not found", 404
@@ -763,23 +1475,97 @@ def start_room(code):
     # Tirer la première carte
     room.game.pick_card()
     logger.info(f"Partie demarree dans salon {code} avec {len(room.players)} joueurs")
-    socketio.emit('game_started', {'room_code': code}, room=f"lobby_{code}")
+    transport.emit('game_started', {'room_code': code}, to=f"lobby_{code}")
     return "", 204
 
 
-@app.route("/game/<code>")
+@bp.route("/game/<code>")
 def play_game(code):
     if code not in rooms:
-        return redirect(url_for("index"))
+        return redirect(url_for(".index"))
     room = rooms[code]
     player_id = session.get('player_id')
     if player_id not in room.players:
-        return redirect(url_for("join_room"))
+        return redirect(url_for(".join_room"))
     if not room.started:
-        return redirect(url_for("lobby", code=code))
+        return redirect(url_for(".lobby", code=code))
     return render_template("game.html", room=room, player_id=player_id)
 
 
+# ==================== Application ====================
+
+_startup = {}
+
+
+def configure_logging():
+    logging.basicConfig(
+        level=getattr(logging, config.LOG_LEVEL),
+        format=config.LOG_FORMAT,
+        datefmt=config.LOG_DATE_FORMAT
+    )
+
+
+def _reset_state(app_config):
+    """Installe la configuration et repart d'un état de jeu vide.
+
+    Salons, présence et mesures de charge sont propres au processus : toutes les
+    applications créées dans un même processus partagent la dernière configuration.
+    """
+    global config, presence, admission
+    if presence is not None and app_config is not config:
+        logger.warning(f"Configuration remplacee par {type(app_config).__name__} "
+                       "pour toutes les applications de ce processus")
+    config = app_config
+    for code in list(rooms):
+        delete_room(code)
+    presence = Presence(config.PRESENCE_GRACE_SECONDS)
+    admission = AdmissionController(
+        config.ADMISSION_MAX_HANDLER_LAG_MS / 1000,
+        config.ADMISSION_MAX_LOOP_LAG_MS / 1000,
+        config.ADMISSION_MAX_QUEUE_DELAY_MS / 1000,
+        config.ADMISSION_WINDOW_SECONDS,
+        config.TIMER_CHECK_INTERVAL,
+    )
+
+
+def create_app(app_config=None):
+    """Construit l'application Flask et y attache le limiter, Socket.IO et les routes.
+
+    Aucun thread n'est démarré ici (voir start_background_workers), et l'état
+    du jeu repart de zéro à chaque appel (voir _reset_state).
+    """
+    started = time.perf_counter()
+    _reset_state(app_config or config)
+    configure_logging()
+
+    app = Flask(__name__, static_folder=None)  # /static est servi par static_asset
+    app.secret_key = config.SECRET_KEY
+    app.config.update(
+        SESSION_COOKIE_HTTPONLY=config.SESSION_COOKIE_HTTPONLY,
+        SESSION_COOKIE_SAMESITE=config.SESSION_COOKIE_SAMESITE,
+        RATELIMIT_DEFAULT="; ".join(config.RATE_LIMIT_DEFAULT),
+    )
+    limiter.init_app(app)
+    socketio.init_app(app, cors_allowed_origins=config.CORS_ALLOWED_ORIGINS)
+    app.register_blueprint(bp)
+
+    static_assets.clear_cache()
+    if not static_assets.load_manifest():
+        logger.warning("Assets non construits (python static_assets.py) : sources servies sans cache long")
+
+    _startup["create_app"] = time.perf_counter() - started
+    logger.info(f"Application prete en {_startup['create_app'] * 1000:.1f} ms "
+                f"(import du module: {_startup['import'] * 1000:.1f} ms)")
+    return app
+
+
+def startup_report():
+    return {name: round(seconds * 1000, 1) for name, seconds in _startup.items()}
+
+
+_startup["import"] = time.perf_counter() - _IMPORT_STARTED
+
+
 if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("C'EST TROP DUR - PICTIONARY")
@@ -790,11 +1576,16 @@ if __name__ == "__main__":
     logger.info(f"  tailscale funnel {config.PORT}")
     logger.info("")
 
-    socketio.run(
-        app,
-        host=config.HOST,
-        port=config.PORT,
-        debug=config.DEBUG,
-        use_reloader=config.USE_RELOADER,
-        allow_unsafe_werkzeug=True
-    )
+    app = create_app()
+    start_background_workers()
+    try:
+        socketio.run(
+            app,
+            host=config.HOST,
+            port=config.PORT,
+            debug=config.DEBUG,
+            use_reloader=config.USE_RELOADER,
+            allow_unsafe_werkzeug=True
+        )
+    finally:
+        stop_background_workers()
@@ -0,0 +1,202 @@
+"""
+Point d'entrée asyncio (ASGI) pour C'est Trop Dur - Pictionary.
+
+Les handlers Socket.IO, le scheduler des timers et le nettoyage tournent comme
+coroutines sur une seule boucle d'événements ; les pages Flask restent servies
+via un adaptateur WSGI -> ASGI.
+
+Utilisation:
+    uvicorn asgi:application --host 0.0.0.0 --port 5016
+    python asgi.py
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookies import SimpleCookie
+
+import socketio
+from asgiref.wsgi import WsgiToAsgi
+from itsdangerous import BadSignature
+
+import app as game
+from config import config
+
+logger = game.logger
+flask_app = game.create_app()
+
+sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins=config.CORS_ALLOWED_ORIGINS)
+
+
+class AsyncTransport:
+    """File d'envoi unique consommée par une tâche : conserve l'ordre des messages.
+
+    Le code de jeu reste synchrone ; il dépose ses envois ici sans attendre,
+    y compris depuis les threads qui servent les routes Flask.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.loop = None
+        self.loop_thread = None
+        self.queue = None
+
+    def bind(self, loop):
+        self.loop = loop
+        self.loop_thread = threading.get_ident()
+        self.queue = asyncio.Queue()
+
+    def _put(self, item):
+        if self.loop is None:
+            return
+        if threading.get_ident() == self.loop_thread:
+            self.queue.put_nowait(item)
+        else:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+    def emit(self, event, data, to=None, skip_sid=None):
+        self._put(('emit', time.monotonic(), event, data, to, skip_sid))
+
+    def enter_room(self, sid, room):
+        self._put(('enter', time.monotonic(), sid, room))
+
+    def leave_room(self, sid, room):
+        self._put(('leave', time.monotonic(), sid, room))
+
+    async def run(self):
+        while True:
+            item = await self.queue.get()
+            # Temps d'attente dans la file : mesure directe de la saturation de la boucle
+            game.admission.record_queue_delay(time.monotonic() - item[1])
+            try:
+                if item[0] == 'emit':
+                    _, _, event, data, to, skip_sid = item
+                    await self.server.emit(event, data, to=to, skip_sid=skip_sid)
+                elif item[0] == 'enter':
+                    await self.server.enter_room(item[2], item[3])
+                else:
+                    await self.server.leave_room(item[2], item[3])
+            except Exception as e:
+                logger.error(f"Erreur envoi Socket.IO: {e}")
+
+
+transport = AsyncTransport(sio)
+
+
+def _player_id_from_environ(environ):
+    """Relit le player_id dans le cookie de session Flask."""
+    cookie = SimpleCookie(environ.get('HTTP_COOKIE', ''))
+    morsel = cookie.get(flask_app.config['SESSION_COOKIE_NAME'])
+    if morsel is None:
+        return None
+    serializer = flask_app.session_interface.get_signing_serializer(flask_app)
+    if serializer is None:
+        return None
+    try:
+        return serializer.loads(morsel.value).get('player_id')
+    except BadSignature:
+        return None
+
+
+@sio.event
+async def connect(sid, environ, auth=None):
+    await sio.save_session(sid, {'player_id': _player_id_from_environ(environ)})
+
+
+@sio.event
+async def disconnect(sid, reason=None):
+    await _dispatch('disconnect', sid)
+
+
+async def _dispatch(event, sid, *args):
+    session = await sio.get_session(sid)
+    handler = game.EVENT_HANDLERS[event]
+    try:
+        with game.connection_context(sid, session.get('player_id')):
+            handler(*args)
+    except Exception as e:
+        logger.error(f"Erreur handler {event}: {e}")
+
+
+def _register(event):
+    async def on_event(sid, data=None):
+        await _dispatch(event, sid, data or {})
+    sio.on(event, on_event)
+
+
+for _event in game.EVENT_HANDLERS:
+    if _event != 'disconnect':
+        _register(_event)
+
+
+async def _run_periodic(tick, interval, name, measure_lag=False, blocking=None):
+    """Appelle `tick` sur la boucle, puis `blocking` (accès disque) dans un thread."""
+    if measure_lag:
+        game.admission.loop_started()
+    try:
+        while True:
+            scheduled = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            try:
+                if tick is not None:
+                    tick()
+            except Exception as e:
+                logger.error(f"Erreur {name}: {e}")
+            if measure_lag:
+                game.admission.record_loop_lag(time.monotonic() - scheduled)
+            if blocking is not None:
+                try:
+                    await asyncio.to_thread(blocking)
+                except Exception as e:
+                    logger.error(f"Erreur {name}: {e}")
+    finally:
+        if measure_lag:
+            game.admission.loop_stopped()
+
+
+_tasks = []
+
+
+async def startup():
+    transport.bind(asyncio.get_running_loop())
+    game.transport = transport
+    # Aucun accès disque sur la boucle : journal de debug, déchargement et nettoyage passent par des threads
+    game.dlog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dlog")
+    _tasks.extend([
+        asyncio.create_task(transport.run()),
+        asyncio.create_task(_run_periodic(game.check_timers_tick, config.TIMER_CHECK_INTERVAL, "check_timers",
+                                          measure_lag=True, blocking=game.enforce_memory_budget)),
+        asyncio.create_task(_run_periodic(None, config.ROOM_CLEANUP_INTERVAL, "cleanup",
+                                          blocking=game.cleanup_rooms_tick)),
+    ])
+    logger.info("Mode asyncio demarre")
+
+
+async def shutdown():
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+    executor, game.dlog_executor = game.dlog_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+application = socketio.ASGIApp(
+    sio,
+    other_asgi_app=WsgiToAsgi(flask_app),
+    on_startup=startup,
+    on_shutdown=shutdown,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    logger.info("=" * 60)
+    logger.info("C'EST TROP DUR - PICTIONARY (asyncio)")
+    logger.info(f"Acces local: http://localhost:{config.PORT}")
+    logger.info("=" * 60)
+
+    uvicorn.run(application, host=config.HOST, port=config.PORT, log_level=config.LOG_LEVEL.lower())
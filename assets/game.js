@@ -0,0 +1,621 @@
+// Contexte de la page, fourni par le template (attributs data-* du body)
+const roomCode = document.body.dataset.roomCode;
+const myPlayerId = document.body.dataset.playerId;
+const isHost = document.body.dataset.isHost === 'true';
+
+const socket = io({ transports: ['websocket', 'polling'] });
+const canvas = document.getElementById('drawCanvas');
+const ctx = canvas.getContext('2d');
+
+let currentColor = '#000000';
+let currentSize = 3;
+let isEraser = false;
+let isDrawing = false;
+let lastX = 0, lastY = 0;
+let amDrawer = false;
+let amPicker = false;
+let gameState = null;
+let timerInterval = null;
+let selectedWordIndex = null;
+let selectedDesignatedId = null;
+let lastChatSeq = 0;  // curseur de rattrapage du chat à la reconnexion
+
+// ==================== Socket ====================
+socket.on('connect', () => {
+  socket.emit('join_game', { room: roomCode, since: lastChatSeq });
+});
+
+// Trame groupée : tous les événements d'un même tick serveur, dans l'ordre
+socket.on('batch', (frame) => {
+  for (const msg of frame) {
+    socket.listeners(msg.event).forEach(fn => fn(msg.data));
+  }
+});
+
+socket.on('game_state_updated', (state) => {
+  gameState = state;
+  updateUI(state);
+});
+
+// Hybride: draw events temps réel + polling toutes les 3s comme filet de sécurité
+let drawSyncInterval = null;
+let lastDrawCount = 0;
+
+function clog(msg) {
+  socket.emit('client_log', { msg: msg });
+}
+
+// Temps réel: chaque trait arrive individuellement
+socket.on('draw_event', (data) => {
+  clog('DRAW_EVENT recu, amDrawer=' + amDrawer);
+  if (amDrawer) return;
+  drawLine(data.x1, data.y1, data.x2, data.y2, data.color, data.size);
+  lastDrawCount++;
+});
+
+// Filet de sécurité: resync complète toutes les 3s si le client a MOINS de traits que le serveur
+socket.on('draw_data_sync', (data) => {
+  const drawData = data.draw_data || [];
+  clog('SYNC recu, amDrawer=' + amDrawer + ' serveur=' + drawData.length + ' local=' + lastDrawCount);
+  if (amDrawer) return;
+  if (drawData.length > lastDrawCount) {
+    clog('SYNC REDESSIN de ' + drawData.length + ' traits (manquait ' + (drawData.length - lastDrawCount) + ')');
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    for (const d of drawData) {
+      drawLine(d.x1, d.y1, d.x2, d.y2, d.color, d.size);
+    }
+    lastDrawCount = drawData.length;
+  }
+});
+
+socket.on('clear_canvas', () => {
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  lastDrawCount = 0;
+});
+
+socket.on('chat_message', (data) => {
+  if (data.seq) {
+    if (data.seq <= lastChatSeq) return;
+    lastChatSeq = data.seq;
+  }
+  addChatMessage(data.player_name, data.text, data.correct, data.pending, data.guesser_id, data.system);
+});
+
+socket.on('chat_history', (data) => {
+  if (data.truncated && lastChatSeq > 0) {
+    addChatMessage('', 'Messages plus anciens non disponibles', false, false, null, true);
+  }
+  for (const msg of data.messages) {
+    if (msg.seq <= lastChatSeq) continue;
+    lastChatSeq = msg.seq;
+    addChatMessage(msg.player_name, msg.text, msg.correct, msg.pending, msg.guesser_id, msg.system);
+  }
+  if (gameState) updateValidateButtons(gameState);
+});
+
+// ==================== UI Update ====================
+function updateUI(state) {
+  amDrawer = (state.current_drawer_id === myPlayerId);
+  amPicker = (state.current_picker_id === myPlayerId);
+  const isDrawingPhase = state.phase === 'drawing_player2' || state.phase === 'drawing_player1';
+
+  // Header
+  document.getElementById('roundInfo').textContent = `Tour ${state.round}/${state.total_rounds}`;
+  if (isDrawingPhase) {
+    if (amDrawer) {
+      document.getElementById('drawerInfo').textContent = 'Vous dessinez !';
+    } else {
+      document.getElementById('drawerInfo').textContent = `${state.current_drawer_name} dessine`;
+    }
+  } else if (state.phase === 'choosing') {
+    document.getElementById('drawerInfo').textContent = amPicker
+      ? 'Vous choisissez un mot'
+      : `${state.current_picker_name} choisit un mot`;
+  } else {
+    document.getElementById('drawerInfo').textContent = '';
+  }
+
+  // Word display
+  const wordDisplay = document.getElementById('wordDisplay');
+  if ((amDrawer || amPicker) && state.current_word) {
+    wordDisplay.textContent = state.current_word;
+  } else if (state.word_hint) {
+    wordDisplay.textContent = state.word_hint;
+  } else if (state.current_word) {
+    wordDisplay.textContent = state.current_word;
+  } else {
+    wordDisplay.textContent = '';
+  }
+
+  // Polling du dessin toutes les 3s pour les non-dessinateurs
+  if (!amDrawer && isDrawingPhase) {
+    if (!drawSyncInterval) {
+      lastDrawCount = 0;
+      socket.emit('request_draw_data', { room: roomCode });
+      drawSyncInterval = setInterval(() => {
+        socket.emit('request_draw_data', { room: roomCode });
+      }, 3000);
+    }
+  } else {
+    if (drawSyncInterval) {
+      clearInterval(drawSyncInterval);
+      drawSyncInterval = null;
+    }
+    if (state.phase === 'choosing') {
+      ctx.clearRect(0, 0, canvas.width, canvas.height);
+      lastDrawCount = 0;
+    }
+  }
+
+  // Timer
+  updateTimer(state.remaining_time, state.phase_token);
+
+  // Tools visibility
+  document.getElementById('drawTools').style.display = (amDrawer && isDrawingPhase) ? 'flex' : 'none';
+
+  // Canvas cursor
+  canvas.style.cursor = (amDrawer && isDrawingPhase) ? 'crosshair' : 'default';
+  canvas.style.pointerEvents = (amDrawer && isDrawingPhase) ? 'auto' : 'none';
+
+  // Chat input - le dessinateur et le picker ne peuvent pas deviner
+  const chatInput = document.getElementById('chatInput');
+  const chatSend = document.getElementById('chatSend');
+  if (amDrawer || amPicker || !isDrawingPhase) {
+    chatInput.disabled = true;
+    chatSend.disabled = true;
+    if (amDrawer) chatInput.placeholder = 'Vous dessinez (validez les reponses)...';
+    else if (amPicker) chatInput.placeholder = 'Validez les reponses des joueurs...';
+    else chatInput.placeholder = 'Tapez votre reponse...';
+  } else {
+    chatInput.disabled = false;
+    chatSend.disabled = false;
+    chatInput.placeholder = 'Tapez votre reponse...';
+  }
+
+  // Scores
+  updateScores(state);
+
+  // Update validation buttons based on pending_guesses state
+  updateValidateButtons(state);
+
+  // Overlays
+  hideAllOverlays();
+
+  if (state.phase === 'choosing') {
+    if (amPicker && state.card_choices) {
+      showChoosingOverlay(state.card_choices, state.designable_players);
+    } else {
+      showWaitingChooseOverlay(state.current_picker_name);
+    }
+  } else if (state.phase === 'round_end') {
+    showRoundEndOverlay(state.current_word, state);
+  } else if (state.phase === 'game_over') {
+    showGameOverOverlay(state);
+  }
+}
+
+// Met à jour les boutons de validation selon les propositions encore en attente
+function updateValidateButtons(state) {
+  if (!state.pending_guesses || !(amPicker || amDrawer)) return;
+  document.querySelectorAll('.chat-msg[data-guesser-id]').forEach(msg => {
+    const gid = msg.dataset.guesserId;
+    const pg = state.pending_guesses[gid];
+    const btn = msg.querySelector('.validate-btn');
+    if (!btn) return;
+    if (!pg) {
+      // Guess no longer pending (accepted or cleared)
+      btn.remove();
+    } else {
+      const myApproval = amPicker ? pg.picker_approved : pg.drawer_approved;
+      if (myApproval) {
+        btn.classList.add('validated');
+        btn.textContent = 'Validé ✓';
+        btn.onclick = null;
+      }
+    }
+  });
+}
+
+function updateTimer(remaining, phaseToken) {
+  const timerEl = document.getElementById('timer');
+  if (remaining > 0) {
+    timerEl.textContent = remaining + 's';
+    timerEl.classList.toggle('warning', remaining <= 15);
+    // Set up client-side countdown
+    clearInterval(timerInterval);
+    let t = remaining;
+    timerInterval = setInterval(() => {
+      t--;
+      if (t <= 0) {
+        clearInterval(timerInterval);
+        timerEl.textContent = '0s';
+        // Notify server time is up
+        socket.emit('timer_expired', { room: roomCode, token: phaseToken });
+      } else {
+        timerEl.textContent = t + 's';
+        timerEl.classList.toggle('warning', t <= 15);
+      }
+    }, 1000);
+  } else {
+    timerEl.textContent = '--';
+    timerEl.classList.remove('warning');
+    clearInterval(timerInterval);
+  }
+}
+
+function updateScores(state) {
+  const panel = document.getElementById('scoresPanel');
+  const isDrawingPhase = state.phase === 'drawing_player2' || state.phase === 'drawing_player1';
+  const sorted = Object.entries(state.scores)
+    .map(([pid, score]) => ({
+      pid, score,
+      name: state.player_names[pid] || '???',
+      isDrawer: pid === state.current_drawer_id && isDrawingPhase,
+      isPicker: pid === state.current_picker_id
+    }))
+    .sort((a, b) => b.score - a.score);
+
+  panel.innerHTML = '<h3>Scores</h3>' + sorted.map(p => {
+    let cls = '';
+    let tag = '';
+    if (p.isDrawer) { cls = 'drawing'; tag = '(dessine)'; }
+    else if (p.isPicker && isDrawingPhase) { tag = '(pioche)'; }
+    return `<div class="score-item ${cls}">
+      <span>${p.name} ${tag}</span>
+      <span class="score-points">${p.score} pts</span>
+    </div>`;
+  }).join('');
+}
+
+// ==================== Overlays ====================
+function hideAllOverlays() {
+  document.querySelectorAll('.overlay').forEach(o => o.classList.add('hidden'));
+}
+
+function showChoosingOverlay(choices, designablePlayers) {
+  selectedWordIndex = null;
+  selectedDesignatedId = null;
+  const overlay = document.getElementById('choosingOverlay');
+  overlay.classList.remove('hidden');
+
+  const container = document.getElementById('cardChoices');
+  container.innerHTML = choices.map((word, i) =>
+    `<div class="card-choice" data-word-index="${i}" onclick="selectWord(this, ${i})">${word}</div>`
+  ).join('');
+
+  const designateSection = document.getElementById('designateSection');
+  const playerContainer = document.getElementById('playerChoices');
+  if (designablePlayers && designablePlayers.length > 0) {
+    playerContainer.innerHTML = designablePlayers.map(p =>
+      `<div class="card-choice" data-player-id="${p.id}" onclick="selectPlayer(this, '${p.id}')">${p.name}</div>`
+    ).join('');
+  }
+  designateSection.style.display = 'none';
+  document.getElementById('confirmChoiceBtn').classList.add('hidden');
+}
+
+function selectWord(el, index) {
+  selectedWordIndex = index;
+  document.querySelectorAll('#cardChoices .card-choice').forEach(c => {
+    c.style.background = 'rgba(255,215,0,0.15)';
+    c.style.color = '#ffd700';
+  });
+  el.style.background = '#ffd700';
+  el.style.color = '#1a1a2e';
+  document.getElementById('designateSection').style.display = 'block';
+  updateConfirmBtn();
+}
+
+function selectPlayer(el, playerId) {
+  selectedDesignatedId = playerId;
+  document.querySelectorAll('#playerChoices .card-choice').forEach(c => {
+    c.style.background = 'rgba(255,215,0,0.15)';
+    c.style.color = '#ffd700';
+  });
+  el.style.background = '#ffd700';
+  el.style.color = '#1a1a2e';
+  updateConfirmBtn();
+}
+
+function updateConfirmBtn() {
+  const btn = document.getElementById('confirmChoiceBtn');
+  if (selectedWordIndex !== null && selectedDesignatedId !== null) {
+    btn.classList.remove('hidden');
+  } else {
+    btn.classList.add('hidden');
+  }
+}
+
+function confirmChoice() {
+  if (selectedWordIndex !== null && selectedDesignatedId !== null) {
+    socket.emit('choose_word', {
+      room: roomCode,
+      index: selectedWordIndex,
+      designated_id: selectedDesignatedId,
+      token: gameState.phase_token
+    });
+  }
+}
+
+function showWaitingChooseOverlay(pickerName) {
+  const overlay = document.getElementById('waitingChooseOverlay');
+  overlay.classList.remove('hidden');
+  document.getElementById('waitingChooseText').textContent = `${pickerName} choisit un mot et designe un joueur...`;
+}
+
+function showRoundEndOverlay(word, state) {
+  const overlay = document.getElementById('roundEndOverlay');
+  overlay.classList.remove('hidden');
+  document.getElementById('revealWord').textContent = word || '???';
+  // Show who won the point
+  const msg = document.getElementById('roundResultMsg');
+  if (state.point_winner_name) {
+    if (state.guessed) {
+      msg.textContent = `${state.point_winner_name} a fait deviner le mot et gagne 1 point !`;
+    } else {
+      msg.textContent = `Personne n'a devine ! ${state.point_winner_name} gagne 1 point.`;
+    }
+    msg.style.color = '#4caf50';
+  } else {
+    msg.textContent = '';
+  }
+  if (isHost) {
+    document.getElementById('nextTurnBtn').classList.remove('hidden');
+    document.getElementById('waitingNextMsg').classList.add('hidden');
+  } else {
+    document.getElementById('nextTurnBtn').classList.add('hidden');
+    document.getElementById('waitingNextMsg').classList.remove('hidden');
+  }
+}
+
+function showGameOverOverlay(state) {
+  const overlay = document.getElementById('gameOverOverlay');
+  overlay.classList.remove('hidden');
+  document.getElementById('revealWordFinal').textContent = state.current_word || '';
+
+  const sorted = Object.entries(state.scores)
+    .map(([pid, score]) => ({ name: state.player_names[pid], score }))
+    .sort((a, b) => b.score - a.score);
+
+  const medals = ['1er', '2eme', '3eme'];
+  document.getElementById('podium').innerHTML = sorted.map((p, i) =>
+    `<div class="podium-item">${medals[i] || (i+1)+'eme'} - ${p.name} : ${p.score} pts</div>`
+  ).join('');
+}
+
+// ==================== Actions ====================
+// chooseWord is now handled by confirmChoice()
+
+function requestNextTurn() {
+  socket.emit('request_next_turn', { room: roomCode, token: gameState.phase_token });
+}
+
+function sendGuess() {
+  const input = document.getElementById('chatInput');
+  const text = input.value.trim();
+  if (!text) return;
+  socket.emit('guess', { room: roomCode, text: text });
+  input.value = '';
+}
+
+document.getElementById('chatInput').addEventListener('keydown', (e) => {
+  if (e.key === 'Enter') sendGuess();
+});
+
+function addChatMessage(name, text, correct, pending, guesserId, system) {
+  const container = document.getElementById('chatMessages');
+  const div = document.createElement('div');
+  if (system) {
+    div.className = 'chat-msg system';
+    div.textContent = text;
+  } else if (correct) {
+    div.className = 'chat-msg correct';
+    div.textContent = `${name} a devine le mot !`;
+  } else {
+    div.className = 'chat-msg';
+    div.innerHTML = `<span class="name">${name}:</span> ${text}`;
+    if (pending && guesserId && (amPicker || amDrawer)) {
+      div.dataset.guesserId = guesserId;
+      const btn = document.createElement('button');
+      btn.className = 'validate-btn';
+      btn.textContent = 'Valider ✓';
+      btn.onclick = () => validateGuess(guesserId, btn);
+      div.appendChild(btn);
+    }
+  }
+  container.appendChild(div);
+  container.scrollTop = container.scrollHeight;
+}
+
+function validateGuess(guesserId, btn) {
+  socket.emit('validate_guess', { room: roomCode, guesser_id: guesserId, token: gameState.phase_token });
+  btn.classList.add('validated');
+  btn.textContent = 'Validé ✓';
+  btn.onclick = null;
+}
+
+// ==================== Canvas Drawing ====================
+function getCanvasCoords(e) {
+  const rect = canvas.getBoundingClientRect();
+  const scaleX = canvas.width / rect.width;
+  const scaleY = canvas.height / rect.height;
+  if (e.touches) {
+    return {
+      x: (e.touches[0].clientX - rect.left) * scaleX,
+      y: (e.touches[0].clientY - rect.top) * scaleY
+    };
+  }
+  return {
+    x: (e.clientX - rect.left) * scaleX,
+    y: (e.clientY - rect.top) * scaleY
+  };
+}
+
+function startDrawing(e) {
+  if (!amDrawer) return;
+  e.preventDefault();
+  isDrawing = true;
+  const coords = getCanvasCoords(e);
+  lastX = coords.x;
+  lastY = coords.y;
+}
+
+function draw(e) {
+  if (!isDrawing || !amDrawer) return;
+  e.preventDefault();
+  const coords = getCanvasCoords(e);
+  const color = isEraser ? '#ffffff' : currentColor;
+  const size = isEraser ? currentSize * 3 : currentSize;
+
+  drawLine(lastX, lastY, coords.x, coords.y, color, size);
+  socket.emit('draw', {
+    room: roomCode,
+    draw_event: { x1: lastX, y1: lastY, x2: coords.x, y2: coords.y, color: color, size: size }
+  });
+  lastX = coords.x;
+  lastY = coords.y;
+}
+
+function stopDrawing() {
+  isDrawing = false;
+}
+
+function drawLine(x1, y1, x2, y2, color, size) {
+  ctx.beginPath();
+  ctx.strokeStyle = color;
+  ctx.lineWidth = size;
+  ctx.lineCap = 'round';
+  ctx.lineJoin = 'round';
+  ctx.moveTo(x1, y1);
+  ctx.lineTo(x2, y2);
+  ctx.stroke();
+}
+
+// Mouse events
+canvas.addEventListener('mousedown', startDrawing);
+canvas.addEventListener('mousemove', draw);
+canvas.addEventListener('mouseup', stopDrawing);
+canvas.addEventListener('mouseout', stopDrawing);
+// Touch events
+canvas.addEventListener('touchstart', startDrawing);
+canvas.addEventListener('touchmove', draw);
+canvas.addEventListener('touchend', stopDrawing);
+
+// Color buttons
+document.querySelectorAll('.color-btn').forEach(btn => {
+  btn.addEventListener('click', () => {
+    document.querySelectorAll('.color-btn').forEach(b => b.classList.remove('active'));
+    btn.classList.add('active');
+    currentColor = btn.dataset.color;
+    isEraser = false;
+    document.getElementById('eraserBtn').classList.remove('active');
+  });
+});
+
+// Size buttons
+document.querySelectorAll('.size-btn').forEach(btn => {
+  btn.addEventListener('click', () => {
+    document.querySelectorAll('.size-btn').forEach(b => b.classList.remove('active'));
+    btn.classList.add('active');
+    currentSize = parseInt(btn.dataset.size);
+  });
+});
+
+// Eraser
+document.getElementById('eraserBtn').addEventListener('click', function() {
+  isEraser = !isEraser;
+  this.classList.toggle('active');
+});
+
+// Clear canvas
+document.getElementById('clearBtn').addEventListener('click', () => {
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  socket.emit('clear_canvas', { room: roomCode });
+});
+
+// ==================== Voice Chat ====================
+let localStream = null;
+let peerConnections = {};
+let isMuted = true;
+const iceConfig = { iceServers: [
+  { urls: 'stun:stun.l.google.com:19302' },
+  { urls: 'stun:stun1.l.google.com:19302' }
+]};
+
+// Restore voice state from lobby
+if (sessionStorage.getItem('voiceMicEnabled') === 'true') {
+  setTimeout(() => startVoice(), 500);
+}
+
+async function toggleVoice() {
+  if (isMuted) await startVoice(); else stopVoice();
+}
+
+async function startVoice() {
+  try {
+    localStream = await navigator.mediaDevices.getUserMedia({ audio: true, video: false });
+    document.getElementById('voiceMiniBtn').textContent = 'Micro ON';
+    document.getElementById('voiceMiniBtn').className = 'voice-mini-btn unmuted';
+    isMuted = false;
+    socket.emit('join_voice', { room: roomCode });
+  } catch (err) {
+    alert('Impossible d\'acceder au microphone.');
+  }
+}
+
+function stopVoice() {
+  if (localStream) { localStream.getTracks().forEach(t => t.stop()); localStream = null; }
+  Object.values(peerConnections).forEach(pc => pc.close());
+  peerConnections = {};
+  document.getElementById('voiceMiniBtn').textContent = 'Micro OFF';
+  document.getElementById('voiceMiniBtn').className = 'voice-mini-btn muted';
+  isMuted = true;
+  socket.emit('leave_voice', { room: roomCode });
+}
+
+function createPeerConnection(remoteId) {
+  const pc = new RTCPeerConnection(iceConfig);
+  if (localStream) localStream.getTracks().forEach(t => pc.addTrack(t, localStream));
+  pc.ontrack = (e) => { const a = new Audio(); a.srcObject = e.streams[0]; a.play(); };
+  pc.onicecandidate = (e) => {
+    if (e.candidate) socket.emit('ice_candidate', { room: roomCode, candidate: e.candidate });
+  };
+  peerConnections[remoteId] = pc;
+  return pc;
+}
+
+socket.on('user_joined', async (data) => {
+  if (!localStream) return;
+  const pc = createPeerConnection(data.player_id);
+  const offer = await pc.createOffer();
+  await pc.setLocalDescription(offer);
+  socket.emit('offer', { room: roomCode, offer: offer });
+});
+
+socket.on('offer', async (data) => {
+  if (!localStream) return;
+  const pc = createPeerConnection(data.from);
+  await pc.setRemoteDescription(new RTCSessionDescription(data.offer));
+  const answer = await pc.createAnswer();
+  await pc.setLocalDescription(answer);
+  socket.emit('answer', { room: roomCode, answer: answer });
+});
+
+socket.on('answer', async (data) => {
+  const pc = peerConnections[data.from];
+  if (pc) await pc.setRemoteDescription(new RTCSessionDescription(data.answer));
+});
+
+socket.on('ice_candidate', async (data) => {
+  const pc = peerConnections[data.from] || Object.values(peerConnections)[0];
+  if (pc) await pc.addIceCandidate(new RTCIceCandidate(data.candidate));
+});
+
+socket.on('user_left', (data) => {
+  if (peerConnections[data.player_id]) {
+    peerConnections[data.player_id].close();
+    delete peerConnections[data.player_id];
+  }
+});
+
+window.addEventListener('beforeunload', () => stopVoice());
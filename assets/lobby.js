@@ -0,0 +1,135 @@
+// Contexte de la page, fourni par le template (attributs data-* du body)
+const roomCode = document.body.dataset.roomCode;
+const playerId = document.body.dataset.playerId;
+
+const socket = io({ transports: ['polling'] });
+
+socket.on('connect', () => {
+  socket.emit('join_lobby', { room: roomCode });
+});
+
+socket.on('lobby_updated', (data) => {
+  document.getElementById('currentPlayers').textContent = data.players.length;
+  const list = document.getElementById('playersList');
+  list.innerHTML = data.players.map(p => `
+    <div class="player-item${p.connected ? '' : ' offline'}">
+      <span class="player-name">${p.name}</span>
+      ${p.id === data.host_id ? '<span class="host-badge">HOTE</span>' : ''}
+    </div>
+  `).join('');
+
+  // L'hôte peut changer (départ de l'hôte précédent) : on suit host_id à chaque mise à jour
+  const isHost = data.host_id === playerId;
+  document.getElementById('hostControls').style.display = isHost ? 'block' : 'none';
+  document.getElementById('guestMsg').style.display = isHost ? 'none' : 'block';
+  if (isHost) {
+    const startBtn = document.getElementById('startBtn');
+    const waitingMsg = document.getElementById('waitingMsg');
+    if (data.players.length >= 2) {
+      startBtn.disabled = false;
+      waitingMsg.style.display = 'none';
+    } else {
+      startBtn.disabled = true;
+      waitingMsg.style.display = 'block';
+    }
+  }
+  if (data.started) {
+    sessionStorage.setItem('voiceMicEnabled', (!isMuted).toString());
+    window.location.href = `/game/${roomCode}`;
+  }
+});
+
+socket.on('game_started', () => {
+  sessionStorage.setItem('voiceMicEnabled', (!isMuted).toString());
+  window.location.href = `/game/${roomCode}`;
+});
+
+function startGame() {
+  fetch(`/lobby/${roomCode}/start`, { method: 'POST' })
+  .then(res => { if (!res.ok) alert('Impossible de demarrer'); })
+  .catch(() => alert('Erreur'));
+}
+
+// Voice Chat
+let localStream = null;
+let peerConnections = {};
+let isMuted = true;
+const iceConfig = { iceServers: [
+  { urls: 'stun:stun.l.google.com:19302' },
+  { urls: 'stun:stun1.l.google.com:19302' }
+]};
+
+async function toggleVoice() {
+  if (isMuted) { await startVoice(); } else { stopVoice(); }
+}
+
+async function startVoice() {
+  try {
+    localStream = await navigator.mediaDevices.getUserMedia({ audio: true, video: false });
+    document.getElementById('voiceBtn').textContent = 'Couper le micro';
+    document.getElementById('voiceBtn').className = 'voice-btn unmuted';
+    document.getElementById('voiceStatus').textContent = 'Chat vocal active';
+    isMuted = false;
+    socket.emit('join_voice', { room: roomCode });
+  } catch (err) {
+    alert('Impossible d\'acceder au microphone.');
+  }
+}
+
+function stopVoice() {
+  if (localStream) { localStream.getTracks().forEach(t => t.stop()); localStream = null; }
+  Object.values(peerConnections).forEach(pc => pc.close());
+  peerConnections = {};
+  document.getElementById('voiceBtn').textContent = 'Activer le micro';
+  document.getElementById('voiceBtn').className = 'voice-btn muted';
+  document.getElementById('voiceStatus').textContent = 'Chat vocal desactive';
+  isMuted = true;
+  socket.emit('leave_voice', { room: roomCode });
+}
+
+function createPeerConnection(remoteId) {
+  const pc = new RTCPeerConnection(iceConfig);
+  if (localStream) localStream.getTracks().forEach(t => pc.addTrack(t, localStream));
+  pc.ontrack = (e) => { const a = new Audio(); a.srcObject = e.streams[0]; a.play(); };
+  pc.onicecandidate = (e) => {
+    if (e.candidate) socket.emit('ice_candidate', { room: roomCode, candidate: e.candidate });
+  };
+  peerConnections[remoteId] = pc;
+  return pc;
+}
+
+socket.on('user_joined', async (data) => {
+  if (!localStream) return;
+  const pc = createPeerConnection(data.player_id);
+  const offer = await pc.createOffer();
+  await pc.setLocalDescription(offer);
+  socket.emit('offer', { room: roomCode, offer: offer });
+});
+
+socket.on('offer', async (data) => {
+  if (!localStream) return;
+  const pc = createPeerConnection(data.from);
+  await pc.setRemoteDescription(new RTCSessionDescription(data.offer));
+  const answer = await pc.createAnswer();
+  await pc.setLocalDescription(answer);
+  socket.emit('answer', { room: roomCode, answer: answer });
+});
+
+socket.on('answer', async (data) => {
+  const pc = peerConnections[data.from];
+  if (pc) await pc.setRemoteDescription(new RTCSessionDescription(data.answer));
+});
+
+socket.on('ice_candidate', async (data) => {
+  const pc = peerConnections[data.from] || Object.values(peerConnections)[0];
+  if (pc) await pc.addIceCandidate(new RTCIceCandidate(data.candidate));
+});
+
+socket.on('user_left', (data) => {
+  if (peerConnections[data.player_id]) {
+    peerConnections[data.player_id].close();
+    delete peerConnections[data.player_id];
+  }
+});
+
+window.addEventListener('beforeunload', () => stopVoice());
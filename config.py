@@ -6,6 +6,7 @@ Utilisation:
 """
 
 import os
+import tempfile
 
 
 class Config:
@@ -20,9 +21,22 @@ class Config:
     RATE_LIMIT_JOIN = "50 per minute"
     ROOM_CLEANUP_INTERVAL = 300
     ROOM_MAX_AGE_HOURS = 2
+    TIMER_CHECK_INTERVAL = 2
     MAX_PLAYERS = 6
     MIN_PLAYERS = 3
     ROUND_TIME_SECONDS = 80
+    PRESENCE_GRACE_SECONDS = 15
+    CHAT_HISTORY_SIZE = 100
+    STATIC_MAX_AGE_SECONDS = 365 * 24 * 3600
+    ADMISSION_MAX_HANDLER_LAG_MS = 250
+    ADMISSION_MAX_LOOP_LAG_MS = 1000
+    ADMISSION_MAX_QUEUE_DELAY_MS = 250
+    ADMISSION_WINDOW_SECONDS = 10
+    ADMISSION_RETRY_AFTER_SECONDS = 15
+    MEMORY_BUDGET_MB = 512
+    DRAW_SPILL_DIR = os.environ.get('DRAW_SPILL_DIR', os.path.join(tempfile.gettempdir(), 'cest_trop_dur_spill'))
+    DRAW_SPILL_IDLE_SECONDS = 60
+    ROOM_EVICT_IDLE_SECONDS = 300
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -51,6 +65,7 @@ class ProductionConfig(Config):
     RATE_LIMIT_CREATE = "10 per minute"
     RATE_LIMIT_JOIN = "20 per minute"
     ROOM_CLEANUP_INTERVAL = 180
+    MEMORY_BUDGET_MB = int(os.environ.get('MEMORY_BUDGET_MB', 512))
     LOG_LEVEL = "INFO"
 
 
@@ -61,6 +76,10 @@ class TestingConfig(Config):
     RATE_LIMIT_DEFAULT = ["99999 per day", "9999 per minute"]
     ROOM_CLEANUP_INTERVAL = 1
     ROOM_MAX_AGE_HOURS = 0.001
+    PRESENCE_GRACE_SECONDS = 1
+    MEMORY_BUDGET_MB = 1
+    DRAW_SPILL_IDLE_SECONDS = 1
+    ROOM_EVICT_IDLE_SECONDS = 1
 
 
 _env = os.environ.get('FLASK_ENV', 'development')
@@ -10,8 +10,9 @@ FUNNEL_PID=$!
 echo "Tailscale Funnel active sur le port 5016"
 echo ""
 
-# Lancer le serveur Flask
+# Construire les assets du client puis lancer le serveur Flask
 cd "$(dirname "$0")"
+python3 static_assets.py
 python3 app.py
 
 # Arreter funnel quand le serveur s'arrete
@@ -0,0 +1,139 @@
+"""
+Pipeline des assets statiques du client (CSS/JS).
+
+Les sources sont dans assets/. La construction écrit dans static/ des fichiers
+nommés d'après le hash de leur contenu, leurs variantes précompressées (.gz,
+et .br si le module brotli est installé), et un manifest.json qui associe
+chaque nom logique à son fichier construit.
+
+La génération précédente (manifest.previous.json) reste sur disque et servie :
+un serveur pas encore redémarré et les pages déjà ouvertes continuent de
+trouver leurs fichiers. Seules les générations plus anciennes sont supprimées.
+
+Utilisation:
+    python static_assets.py
+"""
+
+import functools
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from collections import namedtuple
+
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(BASE_DIR, 'assets')
+BUILD_DIR = os.path.join(BASE_DIR, 'static')
+MANIFEST_FILE = os.path.join(BUILD_DIR, 'manifest.json')
+PREVIOUS_MANIFEST_FILE = os.path.join(BUILD_DIR, 'manifest.previous.json')
+HASH_LENGTH = 12
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))  # par ordre de préférence
+
+Asset = namedtuple('Asset', 'path mimetype encoding etag immutable')
+
+
+def _write(name, content):
+    with open(os.path.join(BUILD_DIR, name), 'wb') as f:
+        f.write(content)
+
+
+def _remove_built(name):
+    for suffix in ("",) + tuple(suffix for _, suffix in ENCODINGS):
+        try:
+            os.remove(os.path.join(BUILD_DIR, name + suffix))
+        except OSError:
+            pass
+
+
+def build():
+    """Construit les bundles et retourne le manifest {nom logique: fichier construit}."""
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    current = _read_manifest(MANIFEST_FILE)
+    previous = _read_manifest(PREVIOUS_MANIFEST_FILE)
+    manifest = {}
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        with open(os.path.join(SOURCE_DIR, name), 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+        stem, ext = os.path.splitext(name)
+        built = f"{stem}.{digest}{ext}"
+        _write(built, content)
+        _write(built + ".gz", gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write(built + ".br", brotli.compress(content, quality=11))
+        manifest[name] = built
+    if manifest != current:
+        # La génération en place devient la précédente ; l'ancienne précédente disparaît
+        stale, previous = previous, current
+        _write_manifest(PREVIOUS_MANIFEST_FILE, previous)
+        _write_manifest(MANIFEST_FILE, manifest)
+        for built in set(stale.values()) - set(previous.values()) - set(manifest.values()):
+            _remove_built(built)
+    clear_cache()
+    return manifest
+
+
+def _write_manifest(path, manifest):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def load_manifest():
+    return _read_manifest(MANIFEST_FILE)
+
+
+@functools.lru_cache(maxsize=None)
+def _served_names():
+    """Fichiers construits servis : génération courante et précédente."""
+    return frozenset(load_manifest().values()) | frozenset(_read_manifest(PREVIOUS_MANIFEST_FILE).values())
+
+
+def clear_cache():
+    load_manifest.cache_clear()
+    _served_names.cache_clear()
+
+
+def built_name(name):
+    """Nom du fichier à servir pour un asset ; la source elle-même si rien n'est construit."""
+    return load_manifest().get(name, name)
+
+
+def resolve(filename, accepted_encodings):
+    """Retrouve l'asset à servir pour `filename`, dans la meilleure variante acceptée."""
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if filename in _served_names():
+        path = safe_join(BUILD_DIR, filename)
+        digest = filename.rsplit('.', 2)[1]
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted_encodings and os.path.isfile(path + suffix):
+                return Asset(path + suffix, mimetype, encoding, f"{digest}-{encoding}", True)
+        return Asset(path, mimetype, None, digest, True)
+    # Sources non construites (développement) : servies telles quelles, sans cache long
+    path = safe_join(SOURCE_DIR, filename)
+    if path and os.path.isfile(path):
+        return Asset(path, mimetype, None, None, False)
+    return None
+
+
+if __name__ == "__main__":
+    for name, built in build().items():
+        print(f"{name} -> {built}")
+    if brotli is None:
+        print("brotli non installe : variantes .br non generees")